@@ -17,12 +17,47 @@ install_requirements = [
     'requests==2.23.0',
 ]
 
+async_requirements = [
+    'aiohttp>=3.6,<4.0',
+]
+
+http2_requirements = [
+    'httpx[http2]>=0.23',
+]
+
+orjson_requirements = [
+    'orjson>=3.0',
+]
+
+msgspec_requirements = [
+    'msgspec>=0.9',
+]
+
+streaming_requirements = [
+    'ijson>=3.0',
+]
+
+cache_requirements = [
+    'cachetools>=4.0',
+]
+
+# urllib3 and aiohttp advertise and decode 'br' automatically when
+# brotli is importable; no code change is needed
+brotli_requirements = [
+    'brotli>=1.0',
+]
+
+dataframe_requirements = [
+    'polars>=0.15',
+]
+
 test_requirements = [
     'pytest>=5.0,<6.0',
     'pytest-flake8',
     'pytest-isort==1.0.0',
     'pytest-cov>=2.7,<3.0',
     'pytest-mock==1.10.4',
+    'aioresponses>=0.6.0',
 ]
 
 docs_requirements = [
@@ -45,7 +80,15 @@ setup(
     include_package_data=True,
     install_requires=install_requirements,
     extras_require={
-        'tests': test_requirements,
+        'async': async_requirements,
+        'http2': http2_requirements,
+        'orjson': orjson_requirements,
+        'msgspec': msgspec_requirements,
+        'streaming': streaming_requirements,
+        'cache': cache_requirements,
+        'brotli': brotli_requirements,
+        'dataframe': dataframe_requirements,
+        'tests': test_requirements + async_requirements + http2_requirements,
         'docs': docs_requirements,
     },
     license='MIT',
@@ -62,13 +105,13 @@ setup(
         'classic',
         'wow',
     ],
+    python_requires='>=3.6',  # f-strings
     classifiers=[
         'Development Status :: 5 - Production/Stable',
         'Intended Audience :: Developers',
         'License :: OSI Approved :: MIT License',
         'Operating System :: OS Independent',
         'Programming Language :: Python',
-        'Programming Language :: Python :: 3.5',
         'Programming Language :: Python :: 3.6',
         'Programming Language :: Python :: 3.7',
         'Topic :: Internet :: WWW/HTTP',
@@ -8,8 +8,13 @@ def session_get_mock(mocker):
 
 
 @pytest.fixture
-def utc_mock(mocker):
-    return mocker.patch('wowapi.api.WowApi._utcnow')
+def session_post_mock(mocker):
+    return mocker.patch('requests.Session.post')
+
+
+@pytest.fixture
+def monotonic_mock(mocker):
+    return mocker.patch('wowapi.api.time.monotonic')
 
 
 def get_success_response():
@@ -1,7 +1,9 @@
 import copy
-from datetime import datetime, timedelta
+import time
 
-from wowapi import WowApi
+import pytest
+
+from wowapi import WowApi, WowApiException
 
 
 class TestGameDataMixin:
@@ -11,12 +13,47 @@ class TestGameDataMixin:
 
         self.api = WowApi('client-id', 'client-secret')
         self.api._access_tokens = {
-            'us': {
-                'token': 'secret',
-                'expiration': datetime.utcnow() + timedelta(hours=1)
-            }
+            'us': ('secret', time.monotonic() + 3600)
         }
 
+    def test_generated_methods_share_code(self):
+        # every table-generated wrapper reuses the factory's single code
+        # object, keeping import time and memory flat as endpoints grow
+        assert (
+            WowApi.get_achievement_index.__code__
+            is WowApi.get_item_data.__code__
+        )
+
+    def test_path_argument_by_keyword(self, response_mock):
+        # the hand-written wrappers took named path parameters; the
+        # generated ones must keep those keyword spellings working
+        self.api.get_item_data('us', 'static-us', id=19019)
+        params = copy.deepcopy(self.params)
+        params['namespace'] = 'static-us'
+        response_mock.assert_called_with(
+            'https://us.api.blizzard.com/data/wow/item/19019', params=params)
+
+    def test_path_argument_missing(self):
+        with pytest.raises(WowApiException) as exc:
+            self.api.get_auctions('us', 'dynamic-us')
+        assert 'connected_realm_id' in str(exc.value)
+
+    # namespace derivation
+
+    def test_namespace_derived_static(self, response_mock):
+        self.api.get_item_data('us', None, 19019)
+        params = copy.deepcopy(self.params)
+        params['namespace'] = 'static-us'
+        response_mock.assert_called_with(
+            'https://us.api.blizzard.com/data/wow/item/19019', params=params)
+
+    def test_namespace_derived_dynamic(self, response_mock):
+        self.api.get_realm_index('us')
+        params = copy.deepcopy(self.params)
+        params['namespace'] = 'dynamic-us'
+        response_mock.assert_called_with(
+            'https://us.api.blizzard.com/data/wow/realm/index', params=params)
+
     # Achievement API
 
     def test_get_achievement_category_index(self, response_mock):
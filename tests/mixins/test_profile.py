@@ -1,5 +1,5 @@
 import copy
-from datetime import datetime, timedelta
+import time
 
 from wowapi import WowApi
 
@@ -11,14 +11,35 @@ class TestProfileMixin(object):
 
         self.api = WowApi('client-id', 'client-secret')
         self.api._access_tokens = {
-            'us': {
-                'token': 'secret',
-                'expiration': datetime.utcnow() + timedelta(hours=1)
-            }
+            'us': ('secret', time.monotonic() + 3600)
         }
 
     # Account Profile API
 
+    def test_namespace_derived_profile(self, response_mock):
+        self.api.get_character_profile_summary('us', None, 'khadgar', 'blizzpro')
+        params = copy.deepcopy(self.params)
+        params['namespace'] = 'profile-us'
+        response_mock.assert_called_with(
+            'https://us.api.blizzard.com/profile/wow/character/khadgar/blizzpro',
+            params=params)
+
+    def test_path_argument_by_keyword(self, response_mock):
+        # the hand-written wrappers took named path parameters; the
+        # generated ones must keep those keyword spellings working
+        self.api.get_protected_character_profile_summary(
+            'us', 'dynamic-us', 'profile-token', realm_id=1, character_id=9000
+        )
+
+        params = {
+            'namespace': 'dynamic-us',
+            'access_token': 'profile-token'
+        }
+
+        response_mock.assert_called_with(
+            'https://us.api.blizzard.com/profile/user/wow/protected-character/1-9000',
+            params=params)
+
     def test_get_account_profile_summary(self, response_mock):
         self.api.get_account_profile_summary(
             'us', 'dynamic-us', 'profile-token'
@@ -1,6 +1,8 @@
-from datetime import datetime, timedelta
+import io
+import time
 
 import pytest
+import urllib3
 from requests.exceptions import RequestException
 
 from wowapi import WowApi, WowApiException
@@ -17,14 +19,8 @@ class TestWowApi(object):
 
         self.authorized_api = WowApi('client-id', 'client-secret')
         self.authorized_api._access_tokens = {
-            'us': {
-                'token': 'secret',
-                'expiration': datetime.utcnow() + timedelta(hours=1)
-            },
-            'cn': {
-                'token': 'secret',
-                'expiration': datetime.utcnow() + timedelta(hours=1)
-            }
+            'us': ('secret', time.monotonic() + 3600),
+            'cn': ('secret', time.monotonic() + 3600)
         }
 
         self.test_url = 'http://example.com'
@@ -33,6 +29,81 @@ class TestWowApi(object):
     def test_instance(self):
         assert not self.api._access_tokens
 
+    def test_connection_pool_settings(self):
+        adapter = self.api._session.get_adapter('https://us.api.blizzard.com')
+        assert adapter._pool_connections == 20
+        assert adapter._pool_maxsize == 100
+
+        api = WowApi('client-id', 'client-secret', pool_connections=5, pool_maxsize=10)
+        adapter = api._session.get_adapter('https://us.api.blizzard.com')
+        assert adapter._pool_connections == 5
+        assert adapter._pool_maxsize == 10
+
+    def test_share_pool(self):
+        try:
+            first = WowApi('client-id', 'client-secret', share_pool=True)
+            second = WowApi('client-id', 'client-secret', share_pool=True)
+
+            assert first._session is second._session
+            assert self.api._session is not first._session
+        finally:
+            WowApi._shared_session = None
+
+    def test_retry_conn_failures_detaches_shared_session(self):
+        try:
+            shared = WowApi('client-id', 'client-secret', share_pool=True)
+            retrying = WowApi('client-id', 'client-secret', share_pool=True,
+                              retry_conn_failures=True)
+
+            # the shared session and its adapter stay untouched
+            assert shared._session is WowApi._shared_session
+            assert retrying._session is not shared._session
+            adapter = shared._session.get_adapter('https://us.api.blizzard.com')
+            assert adapter.max_retries.total == 0
+        finally:
+            WowApi._shared_session = None
+
+    def test_retry_conn_failures_keeps_pool_settings(self):
+        api = WowApi('client-id', 'client-secret', retry_conn_failures=True,
+                     pool_connections=5, pool_maxsize=10)
+        adapter = api._session.get_adapter('https://us.api.blizzard.com')
+        assert adapter._pool_connections == 5
+        assert adapter._pool_maxsize == 10
+        assert adapter.max_retries.total == 5
+
+    def test_refresh_token_double_check(self, mocker):
+        creds_mock = mocker.patch.object(WowApi, '_get_client_credentials')
+
+        # another thread already refreshed: no OAuth call
+        self.api._access_tokens = {'us': ('secret', time.monotonic() + 3600)}
+        self.api._refresh_token('us')
+        assert not creds_mock.called
+
+        self.api._access_tokens = {}
+        self.api._refresh_token('us')
+        assert creds_mock.called
+
+    def test_prewarm(self, mocker):
+        head_mock = mocker.patch('requests.Session.head')
+        self.api.prewarm('us')
+
+        assert head_mock.call_count == 2
+        head_mock.assert_any_call('https://us.api.blizzard.com/', timeout=10)
+        head_mock.assert_any_call('https://us.battle.net', timeout=10)
+
+    def test_prewarm_on_init(self, mocker):
+        head_mock = mocker.patch('requests.Session.head')
+        api = WowApi('client-id', 'client-secret', prewarm=('us', 'eu'))
+        api._prewarm_executor.shutdown(wait=True)
+
+        assert head_mock.call_count == 4
+
+    def test_retry_conn_failures_default_forcelist(self):
+        self.api.retry_conn_failures()
+        adapter = self.api._session.get_adapter('https://us.api.blizzard.com')
+        assert adapter.max_retries.status_forcelist == frozenset({429, 500, 502, 503, 504})
+        assert adapter.max_retries.respect_retry_after_header
+
     def test_handle_request_success(self, session_get_mock):
         session_get_mock.return_value = ResponseMock()(200, b'{}')
         data = self.api._handle_request(self.test_url)
@@ -60,6 +131,166 @@ class TestWowApi(object):
 
         assert '404' in str(exc.value)
 
+    def test_timeout_passed_through(self, session_get_mock):
+        api = WowApi('client-id', 'client-secret', timeout=(3, 10))
+        session_get_mock.return_value = ResponseMock()(200, b'{}')
+
+        api._handle_request(self.test_url)
+        session_get_mock.assert_called_with(self.test_url, timeout=(3, 10))
+
+        # the default leaves requests untouched
+        self.api._handle_request(self.test_url)
+        session_get_mock.assert_called_with(self.test_url)
+
+    def test_token_bucket(self, monotonic_mock, mocker):
+        from wowapi.api import _TokenBucket
+
+        sleep_mock = mocker.patch('wowapi.api.time.sleep')
+        monotonic_mock.side_effect = [0, 0, 0, 1]
+
+        bucket = _TokenBucket(rate=1, capacity=1)
+        bucket.acquire()
+
+        # drained: acquire sleeps until a token accrues
+        bucket.acquire()
+        sleep_mock.assert_called_with(1.0)
+
+    def test_handle_request_429_retry_after(self, session_get_mock, mocker):
+        sleep_mock = mocker.patch('wowapi.api.time.sleep')
+
+        limited = ResponseMock()(429, b'{}')
+        limited.headers['retry-after'] = '2'
+        session_get_mock.side_effect = [
+            limited,
+            ResponseMock()(200, b'{"response": "ok"}'),
+        ]
+
+        data = self.api._handle_request(self.test_url)
+
+        assert data == {'response': 'ok'}
+        sleep_mock.assert_called_with(2.0)
+        assert session_get_mock.call_count == 2
+
+    def test_rate_limit_applied(self, session_get_mock, mocker):
+        api = WowApi('client-id', 'client-secret', rate_limit=100)
+        acquire_mock = mocker.patch.object(api._bucket, 'acquire')
+        session_get_mock.return_value = ResponseMock()(200, b'{}')
+
+        api._handle_request(self.test_url)
+
+        assert acquire_mock.called
+
+    def test_handle_request_401_refresh_retry(self, session_get_mock, mocker):
+        def creds(region):
+            self.api._access_tokens[region] = ('fresh', time.monotonic() + 3600)
+            self.api._base_params[region] = {'access_token': 'fresh'}
+
+        creds_mock = mocker.patch.object(
+            WowApi, '_get_client_credentials', side_effect=creds)
+        session_get_mock.side_effect = [
+            ResponseMock()(401, b'{}'),
+            ResponseMock()(200, b'{"response": "ok"}'),
+        ]
+
+        data = self.api._handle_request(
+            self.test_url, region='us', params={'access_token': 'old'})
+
+        assert data == {'response': 'ok'}
+        assert creds_mock.called
+        session_get_mock.assert_called_with(self.test_url, params={'access_token': 'fresh'})
+
+    def test_handle_request_401_refresh_bounded(self, session_get_mock, mocker):
+        mocker.patch.object(WowApi, '_get_client_credentials')
+        session_get_mock.return_value = ResponseMock()(401, b'{}')
+
+        # only one refresh is attempted; a second 401 surfaces as an error
+        with pytest.raises(WowApiException) as exc:
+            self.api._handle_request(self.test_url, region='us')
+
+        assert '401' in str(exc.value)
+        assert session_get_mock.call_count == 2
+
+    def test_response_cache_disabled_by_default(self, session_get_mock):
+        session_get_mock.return_value = ResponseMock()(200, b'{"foo": "bar"}')
+
+        self.authorized_api.get_resource('foo', 'us')
+        self.authorized_api.get_resource('foo', 'us')
+
+        assert session_get_mock.call_count == 2
+
+    def test_response_cache(self, session_get_mock):
+        pytest.importorskip('cachetools')
+
+        api = WowApi('client-id', 'client-secret', cache=True)
+        api._access_tokens = {'us': ('secret', time.monotonic() + 3600)}
+
+        session_get_mock.return_value = ResponseMock()(200, b'{"foo": "bar"}')
+
+        first = api.get_resource('foo', 'us')
+        second = api.get_resource('foo', 'us')
+
+        assert first == second == {'foo': 'bar'}
+        assert session_get_mock.call_count == 1
+
+        # different params miss the cache
+        api.get_resource('foo', 'us', locale='de_DE')
+        assert session_get_mock.call_count == 2
+
+    def test_response_cache_survives_token_refresh(self, session_get_mock):
+        pytest.importorskip('cachetools')
+
+        api = WowApi('client-id', 'client-secret', cache=True)
+        api._access_tokens = {'us': ('secret', time.monotonic() + 3600)}
+
+        session_get_mock.return_value = ResponseMock()(200, b'{"foo": "bar"}')
+        api.get_resource('foo', 'us')
+
+        # a refreshed token must not invalidate cached responses
+        api._access_tokens = {'us': ('refreshed', time.monotonic() + 3600)}
+        api._base_params = {'us': {'access_token': 'refreshed'}}
+        api.get_resource('foo', 'us')
+
+        assert session_get_mock.call_count == 1
+
+    def test_response_cache_etag_revalidation(self, session_get_mock):
+        pytest.importorskip('cachetools')
+
+        api = WowApi('client-id', 'client-secret', cache=True)
+        api._access_tokens = {'us': ('secret', time.monotonic() + 3600)}
+
+        fresh = ResponseMock()(200, b'{"foo": "bar"}')
+        fresh.headers['cache-control'] = 'max-age=0'
+        fresh.headers['etag'] = '"abc"'
+        not_modified = ResponseMock()(304, b'')
+        session_get_mock.side_effect = [fresh, not_modified]
+
+        assert api.get_resource('foo', 'us') == {'foo': 'bar'}
+
+        # the stale entry is revalidated with If-None-Match; the 304
+        # serves the cached body and renews its deadline
+        assert api.get_resource('foo', 'us') == {'foo': 'bar'}
+        assert session_get_mock.call_count == 2
+        headers = session_get_mock.call_args[1]['headers']
+        assert headers['If-None-Match'] == '"abc"'
+
+        assert api.get_resource('foo', 'us') == {'foo': 'bar'}
+        assert session_get_mock.call_count == 2
+
+    def test_response_cache_respects_max_age(self, session_get_mock):
+        pytest.importorskip('cachetools')
+
+        api = WowApi('client-id', 'client-secret', cache=True)
+        api._access_tokens = {'us': ('secret', time.monotonic() + 3600)}
+
+        response = ResponseMock()(200, b'{"foo": "bar"}')
+        response.headers['cache-control'] = 'max-age=0'
+        session_get_mock.return_value = response
+
+        api.get_resource('foo', 'us')
+        api.get_resource('foo', 'us')
+
+        assert session_get_mock.call_count == 2
+
     def test_get_data_resource_authorized(self, session_get_mock):
         session_get_mock.return_value = ResponseMock()(200, b'{}')
         self.authorized_api.get_data_resource('https://us.api.blizzard.com/profile/wow/test', 'us')
@@ -106,6 +337,178 @@ class TestWowApi(object):
             }
         )
 
+    def test_get_items_bulk(self, response_mock):
+        results = self.authorized_api.get_items_bulk('us', 'static-us', [1, 2])
+
+        assert results == [{}, {}]
+        assert response_mock.call_count == 2
+        response_mock.assert_any_call(
+            'https://us.api.blizzard.com/data/wow/item/1',
+            params={
+                'access_token': 'secret',
+                'namespace': 'static-us',
+            }
+        )
+        response_mock.assert_any_call(
+            'https://us.api.blizzard.com/data/wow/item/2',
+            params={
+                'access_token': 'secret',
+                'namespace': 'static-us',
+            }
+        )
+
+    def test_parallel(self, response_mock):
+        results = self.authorized_api.parallel([
+            ('get_item_data', ('us', 'static-us', 19019), {}),
+            ('get_resource', ('foo', 'us'), {'locale': 'en_US'}),
+        ])
+
+        assert results == [{}, {}]
+        assert response_mock.call_count == 2
+        response_mock.assert_any_call(
+            'https://us.api.blizzard.com/data/wow/item/19019',
+            params={
+                'access_token': 'secret',
+                'namespace': 'static-us',
+            }
+        )
+        response_mock.assert_any_call(
+            'https://us.api.blizzard.com/foo',
+            params={
+                'access_token': 'secret',
+                'locale': 'en_US',
+            }
+        )
+
+    def test_parallel_empty(self):
+        assert self.authorized_api.parallel([]) == []
+
+    def test_batch(self, response_mock):
+        results = self.authorized_api.batch([
+            {'method': 'get_item_data', 'args': ('us', 'static-us', 19019)},
+            {'method': 'get_resource', 'args': ('foo', 'us'),
+             'kwargs': {'locale': 'en_US'}},
+        ])
+
+        assert results == [{}, {}]
+        assert response_mock.call_count == 2
+
+    def test_batch_return_exceptions(self, session_get_mock):
+        session_get_mock.side_effect = [
+            ResponseMock()(200, b'{"foo": "bar"}'),
+            RequestException('Error'),
+        ]
+
+        first, second = self.authorized_api.batch([
+            {'method': '_handle_request', 'args': (self.test_url,)},
+            {'method': '_handle_request', 'args': (self.test_url,)},
+        ], max_workers=1, return_exceptions=True)
+
+        assert first == {'foo': 'bar'}
+        assert isinstance(second, WowApiException)
+
+    def test_get_character_full_profile(self, response_mock):
+        data = self.authorized_api.get_character_full_profile(
+            'us', 'profile-us', 'khadgar', 'asmon', include=['profile', 'equipment'])
+
+        assert data == {'profile': {}, 'equipment': {}}
+        assert response_mock.call_count == 2
+        response_mock.assert_any_call(
+            'https://us.api.blizzard.com/profile/wow/character/khadgar/asmon',
+            params={
+                'access_token': 'secret',
+                'namespace': 'profile-us',
+            }
+        )
+        response_mock.assert_any_call(
+            'https://us.api.blizzard.com/profile/wow/character/khadgar/asmon/equipment',
+            params={
+                'access_token': 'secret',
+                'namespace': 'profile-us',
+            }
+        )
+
+    def test_get_character_full_profile_defaults(self, response_mock):
+        data = self.authorized_api.get_character_full_profile(
+            'us', 'profile-us', 'khadgar', 'asmon')
+
+        assert response_mock.call_count == 8
+        assert set(data) == {
+            'profile', 'equipment', 'media', 'achievements', 'appearance',
+            'specializations', 'statistics', 'titles',
+        }
+
+    def test_get_character_full_profile_unknown_part(self):
+        with pytest.raises(WowApiException) as exc:
+            self.authorized_api.get_character_full_profile(
+                'us', 'profile-us', 'khadgar', 'asmon', include=['nope'])
+
+        assert 'nope' in str(exc.value)
+
+    def test_stream_resource(self, session_get_mock):
+        pytest.importorskip('ijson')
+
+        content = b'{"auctions": [{"id": 1}, {"id": 2}]}'
+        response = ResponseMock()(200, content)
+        response.raw = urllib3.HTTPResponse(body=io.BytesIO(content), preload_content=False)
+        session_get_mock.return_value = response
+
+        items = list(self.authorized_api.stream_resource(
+            'resource/{0}', 'us', 'auctions.item', 1, namespace='dynamic-us'))
+
+        assert items == [{'id': 1}, {'id': 2}]
+        session_get_mock.assert_called_with(
+            'https://us.api.blizzard.com/resource/1',
+            stream=True,
+            params={
+                'access_token': 'secret',
+                'namespace': 'dynamic-us',
+            }
+        )
+
+    def test_get_pvp_leaderboard_df(self, session_get_mock):
+        pytest.importorskip('polars')
+
+        content = b'{"season": 27, "entries": [{"rank": 1, "rating": 2801}, ' \
+                  b'{"rank": 2, "rating": 2756}]}'
+        session_get_mock.return_value = ResponseMock()(200, content)
+
+        df = self.authorized_api.get_pvp_leaderboard_df('us', 'dynamic-us', 27, '3v3')
+
+        assert df.shape == (2, 2)
+        assert df['rating'].to_list() == [2801, 2756]
+
+    def test_get_pvp_leaderboard_df_empty(self, session_get_mock):
+        pytest.importorskip('polars')
+
+        content = b'{"season": 27, "entries": []}'
+        session_get_mock.return_value = ResponseMock()(200, content)
+
+        df = self.authorized_api.get_pvp_leaderboard_df('us', 'dynamic-us', 27, '3v3')
+
+        assert df.shape == (0, 0)
+
+    def test_stream_pvp_leaderboard(self, session_get_mock):
+        pytest.importorskip('ijson')
+
+        content = b'{"season": 27, "entries": [{"rank": 1}, {"rank": 2}]}'
+        response = ResponseMock()(200, content)
+        response.raw = urllib3.HTTPResponse(body=io.BytesIO(content), preload_content=False)
+        session_get_mock.return_value = response
+
+        entries = list(self.authorized_api.stream_pvp_leaderboard(
+            'us', 'dynamic-us', 27, '3v3'))
+
+        assert entries == [{'rank': 1}, {'rank': 2}]
+        session_get_mock.assert_called_with(
+            'https://us.api.blizzard.com/data/wow/pvp-season/27/pvp-leaderboard/3v3',
+            stream=True,
+            params={
+                'access_token': 'secret',
+                'namespace': 'dynamic-us',
+            }
+        )
+
     def test_get_resource_call_china(self, response_mock):
         self.authorized_api.get_resource('resource/{0}', 'cn', 1)
 
@@ -116,51 +519,57 @@ class TestWowApi(object):
             }
         )
 
-    def test_get_resource_no_access_token(self, session_get_mock, utc_mock):
-        now = datetime.utcnow()
-        utc_mock.return_value = now
+    def test_get_resource_no_access_token(
+        self, session_get_mock, session_post_mock, monotonic_mock
+    ):
+        monotonic_mock.return_value = 1000.0
 
-        session_get_mock.side_effect = [
-            ResponseMock()(200, b'{"access_token": "111", "expires_in": 60}'),
-            ResponseMock()(200, b'{"response": "ok"}'),
-        ]
+        session_post_mock.return_value = ResponseMock()(
+            200, b'{"access_token": "111", "expires_in": 60}')
+        session_get_mock.return_value = ResponseMock()(200, b'{"response": "ok"}')
         data = self.api.get_resource('foo', 'eu')
 
         assert data == {'response': 'ok'}
         assert self.api._access_tokens == {
-            'eu': {
-                'token': '111',
-                'expiration': now + timedelta(seconds=60)
-            }
+            'eu': ('111', 1000.0 + 60 - 30)
         }
 
-    def test_get_resource_no_access_expired(self, session_get_mock, utc_mock):
-        now = datetime.utcnow()
-        utc_mock.return_value = now
+    def test_get_resource_no_access_expired(
+        self, session_get_mock, session_post_mock, monotonic_mock
+    ):
+        monotonic_mock.return_value = 1000.0
 
+        # deadline in the past: a fresh token must be fetched
         self.api._access_tokens = {
-            'eu': {
-                'token': '222',
-                'expiration': now
-            }
+            'eu': ('222', 999.0)
         }
 
-        session_get_mock.side_effect = [
-            ResponseMock()(200, b'{"access_token": "333", "expires_in": 60}'),
-            ResponseMock()(200, b'{"response": "ok"}'),
-        ]
+        session_post_mock.return_value = ResponseMock()(
+            200, b'{"access_token": "333", "expires_in": 60}')
+        session_get_mock.return_value = ResponseMock()(200, b'{"response": "ok"}')
         data = self.api.get_resource('foo', 'eu')
 
         assert data == {'response': 'ok'}
         assert self.api._access_tokens == {
-            'eu': {
-                'token': '333',
-                'expiration': now + timedelta(seconds=60)
-            }
+            'eu': ('333', 1000.0 + 60 - 30)
         }
 
+    def test_loads_decoder_preference(self, mocker):
+        from wowapi.api import _loads
+
+        assert _loads(b'{"foo": "bar"}') == {'foo': 'bar'}
+
+        # without orjson the msgspec decoder takes over, then the stdlib
+        mocker.patch('wowapi.api.orjson', None)
+        assert _loads(b'{"foo": "bar"}') == {'foo': 'bar'}
+
+        mocker.patch('wowapi.api.msgspec', None)
+        assert _loads(b'{"foo": "bar"}') == {'foo': 'bar'}
+
     def test_format_base_url(self):
         assert self.api._format_base_url('test', 'us') == 'https://us.api.blizzard.com/test'
         assert self.api._format_base_url('test', 'cn') == (
             'https://www.gateway.battlenet.com.cn/test'
         )
+        # unknown regions fall back to the generic host pattern
+        assert self.api._format_base_url('test', 'xx') == 'https://xx.api.blizzard.com/test'
@@ -0,0 +1,149 @@
+import asyncio
+import time
+
+import pytest
+from aioresponses import aioresponses
+
+from wowapi import AsyncWowApi, WowApiException
+
+
+class TestAsyncWowApi(object):
+
+    def setup(self):
+        self.api = AsyncWowApi('client-id', 'client-secret')
+
+        self.authorized_api = AsyncWowApi('client-id', 'client-secret')
+        self.authorized_api._access_tokens = {
+            'us': ('secret', time.monotonic() + 3600)
+        }
+
+        self.test_url = 'http://example.com'
+
+    def run(self, coro):
+        async def main():
+            try:
+                return await coro
+            finally:
+                await self.api.close()
+                await self.authorized_api.close()
+
+        return asyncio.new_event_loop().run_until_complete(main())
+
+    def test_instance(self):
+        assert not self.api._access_tokens
+
+    def test_handle_request_success(self):
+        with aioresponses() as mocked:
+            mocked.get(self.test_url, payload={})
+            data = self.run(self.api._handle_request(self.test_url))
+
+        assert data == {}
+
+    def test_handle_request_invalid_json(self):
+        with aioresponses() as mocked:
+            mocked.get(self.test_url, body=b'{"foo": "bar"},')
+            with pytest.raises(WowApiException) as exc:
+                self.run(self.api._handle_request(self.test_url))
+
+        assert 'Invalid Json' in str(exc.value)
+
+    def test_handle_request_404(self):
+        with aioresponses() as mocked:
+            mocked.get(self.test_url, status=404, payload={})
+            with pytest.raises(WowApiException) as exc:
+                self.run(self.api._handle_request(self.test_url))
+
+        assert '404' in str(exc.value)
+
+    def test_get_data_resource_authorized(self):
+        url = 'https://us.api.blizzard.com/profile/wow/test'
+        with aioresponses() as mocked:
+            mocked.get('{0}?access_token=secret'.format(url), payload={})
+            data = self.run(self.authorized_api.get_data_resource(url, 'us'))
+
+        assert data == {}
+
+    def test_get_resource_call(self):
+        with aioresponses() as mocked:
+            mocked.get(
+                'https://us.api.blizzard.com/resource/1?access_token=secret&locale=en_US',
+                payload={'response': 'ok'}
+            )
+            data = self.run(
+                self.authorized_api.get_resource('resource/{0}', 'us', 1, locale='en_US'))
+
+        assert data == {'response': 'ok'}
+
+    def test_get_resource_no_access_token(self):
+        with aioresponses() as mocked:
+            mocked.post(
+                'https://eu.battle.net/oauth/token?grant_type=client_credentials'
+                '&client_id=client-id&client_secret=client-secret',
+                payload={'access_token': '111', 'expires_in': 60}
+            )
+            mocked.get(
+                'https://eu.api.blizzard.com/foo?access_token=111',
+                payload={'response': 'ok'}
+            )
+            data = self.run(self.api.get_resource('foo', 'eu'))
+
+        assert data == {'response': 'ok'}
+        assert self.api._access_tokens['eu'][0] == '111'
+
+    def test_get_character_full_profile(self):
+        with aioresponses() as mocked:
+            mocked.get(
+                'https://us.api.blizzard.com/profile/wow/character/khadgar/asmon'
+                '?access_token=secret&namespace=profile-us',
+                payload={'name': 'asmon'}
+            )
+            mocked.get(
+                'https://us.api.blizzard.com/profile/wow/character/khadgar/asmon/equipment'
+                '?access_token=secret&namespace=profile-us',
+                payload={'equipped_items': []}
+            )
+            data = self.run(self.authorized_api.get_character_full_profile(
+                'us', 'profile-us', 'khadgar', 'asmon',
+                include=['profile', 'equipment']))
+
+        assert data == {
+            'profile': {'name': 'asmon'},
+            'equipment': {'equipped_items': []},
+        }
+
+    def test_mixin_methods_return_coroutines(self):
+        with aioresponses() as mocked:
+            mocked.get(
+                'https://us.api.blizzard.com/data/wow/item/19019'
+                '?access_token=secret&namespace=static-us',
+                payload={'id': 19019}
+            )
+            data = self.run(self.authorized_api.get_item_data('us', 'static-us', 19019))
+
+        assert data == {'id': 19019}
+
+    def test_stream_token(self):
+        url = ('https://us.api.blizzard.com/data/wow/token/index'
+               '?access_token=secret&namespace=dynamic-us')
+
+        async def collect():
+            prices = []
+            async for price in self.authorized_api.stream_token('us', interval=0):
+                prices.append(price)
+                if len(prices) == 2:
+                    return prices
+
+        with aioresponses() as mocked:
+            mocked.get(url, payload={'price': 1}, headers={'ETag': '"abc"'})
+            # unchanged price: the 304 yields nothing
+            mocked.get(url, status=304)
+            mocked.get(url, payload={'price': 2}, headers={'ETag': '"def"'})
+            prices = self.run(collect())
+
+        assert prices == [{'price': 1}, {'price': 2}]
+
+    def test_format_base_url(self):
+        assert self.api._format_base_url('test', 'us') == 'https://us.api.blizzard.com/test'
+        assert self.api._format_base_url('test', 'cn') == (
+            'https://www.gateway.battlenet.com.cn/test'
+        )
@@ -0,0 +1,82 @@
+import time
+
+import httpx
+import pytest
+
+from wowapi import HTTPXWowApi, WowApiException
+
+
+class TestHTTPXWowApi(object):
+
+    def setup(self):
+        self.api = HTTPXWowApi('client-id', 'client-secret')
+
+        self.authorized_api = HTTPXWowApi('client-id', 'client-secret')
+        self.authorized_api._access_tokens = {
+            'us': ('secret', time.monotonic() + 3600)
+        }
+
+        self.test_url = 'http://example.com'
+
+    def test_instance(self):
+        assert not self.api._access_tokens
+
+    def test_handle_request_success(self, mocker):
+        get_mock = mocker.patch('httpx.Client.get')
+        get_mock.return_value = httpx.Response(200, content=b'{}')
+
+        data = self.api._handle_request(self.test_url)
+
+        assert data == {}
+        get_mock.assert_called_with(self.test_url)
+
+    def test_handle_request_invalid_json(self, mocker):
+        get_mock = mocker.patch('httpx.Client.get')
+        get_mock.return_value = httpx.Response(200, content=b'{"foo": "bar"},')
+
+        with pytest.raises(WowApiException) as exc:
+            self.api._handle_request(self.test_url)
+
+        assert 'Invalid Json' in str(exc.value)
+
+    def test_handle_request_404(self, mocker):
+        get_mock = mocker.patch('httpx.Client.get')
+        get_mock.return_value = httpx.Response(404, content=b'{}')
+
+        with pytest.raises(WowApiException) as exc:
+            self.api._handle_request(self.test_url)
+
+        assert '404' in str(exc.value)
+
+    def test_get_resource_call(self, mocker):
+        get_mock = mocker.patch('httpx.Client.get')
+        get_mock.return_value = httpx.Response(200, content=b'{"response": "ok"}')
+
+        data = self.authorized_api.get_resource('resource/{0}', 'us', 1, locale='en_US')
+
+        assert data == {'response': 'ok'}
+        get_mock.assert_called_with(
+            'https://us.api.blizzard.com/resource/1',
+            params={
+                'locale': 'en_US',
+                'access_token': 'secret',
+            }
+        )
+
+    def test_get_resource_no_access_token(self, mocker):
+        post_mock = mocker.patch('httpx.Client.post')
+        post_mock.return_value = httpx.Response(
+            200, content=b'{"access_token": "111", "expires_in": 60}')
+        get_mock = mocker.patch('httpx.Client.get')
+        get_mock.return_value = httpx.Response(200, content=b'{"response": "ok"}')
+
+        data = self.api.get_resource('foo', 'eu')
+
+        assert data == {'response': 'ok'}
+        assert self.api._access_tokens['eu'][0] == '111'
+
+    def test_format_base_url(self):
+        assert self.api._format_base_url('test', 'us') == 'https://us.api.blizzard.com/test'
+        assert self.api._format_base_url('test', 'cn') == (
+            'https://www.gateway.battlenet.com.cn/test'
+        )
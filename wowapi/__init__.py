@@ -1,2 +1,13 @@
 from .api import WowApi  # noqa
 from .exceptions import WowApiException, WowApiOauthException  # noqa
+
+
+try:
+    from .async_api import AsyncWowApi  # noqa
+except ImportError:  # aiohttp is an optional dependency
+    pass
+
+try:
+    from .httpx_api import HTTPXWowApi  # noqa
+except ImportError:  # httpx is an optional dependency
+    pass
@@ -1,5 +1,8 @@
+import json as _json
 import logging
-from datetime import datetime, timedelta
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 import requests
 from requests.adapters import HTTPAdapter
@@ -10,10 +13,140 @@ from .exceptions import WowApiException, WowApiOauthException
 from .mixins import GameDataMixin, ProfileMixin
 
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional accelerator
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # msgspec is an optional accelerator
+    msgspec = None
+
+try:
+    import ijson
+except ImportError:  # ijson is only needed for streaming responses
+    ijson = None
+
+try:
+    from cachetools import TTLCache
+except ImportError:  # cachetools is only needed for response caching
+    TTLCache = None
+
+try:
+    import polars
+except ImportError:  # polars is only needed for DataFrame helpers
+    polars = None
+
+
 logger = logging.getLogger('wowapi')
 logger.addHandler(logging.NullHandler())
 
 
+# region -> (api url prefix, oauth url prefix); looked up once per request
+# instead of rebuilding the host string and branching on 'cn' in every hot
+# function. Full prefixes make building a request url a single concat.
+_REGION_HOSTS = {
+    'us': ('https://us.api.blizzard.com', 'https://us.battle.net'),
+    'eu': ('https://eu.api.blizzard.com', 'https://eu.battle.net'),
+    'kr': ('https://kr.api.blizzard.com', 'https://kr.battle.net'),
+    'tw': ('https://tw.api.blizzard.com', 'https://tw.battle.net'),
+    'cn': ('https://www.gateway.battlenet.com.cn', 'https://www.battlenet.com.cn'),
+}
+
+
+def _loads(data):
+    # orjson and msgspec both parse considerably faster than the stdlib
+    # decoder, which matters for multi-megabyte payloads like
+    # get_auctions; whichever accelerator is installed wins
+    if orjson is not None:
+        return orjson.loads(data)
+    if msgspec is not None:
+        return msgspec.json.decode(data)
+    return _json.loads(data)
+
+
+def _parse_max_age(cache_control):
+    if not cache_control:
+        return None
+
+    for part in cache_control.split(','):
+        part = part.strip()
+        if part.startswith('max-age='):
+            try:
+                return int(part[8:])
+            except ValueError:
+                return None
+
+    return None
+
+
+# character sub-resources fetched by get_character_full_profile; the
+# keys double as the `include` vocabulary and the result dict keys
+_FULL_PROFILE_PARTS = {
+    'profile': 'get_character_profile_summary',
+    'equipment': 'get_character_equipment_summary',
+    'media': 'get_character_media_summary',
+    'achievements': 'get_character_achievements_summary',
+    'appearance': 'get_character_appearance_summary',
+    'specializations': 'get_character_specializations_summary',
+    'statistics': 'get_character_stats_summary',
+    'titles': 'get_character_titles_summary',
+}
+
+
+def _full_profile_parts(include):
+    parts = tuple(include) if include is not None else tuple(_FULL_PROFILE_PARTS)
+    for part in parts:
+        if part not in _FULL_PROFILE_PARTS:
+            raise WowApiException('Unknown character profile part: {0}'.format(part))
+    return parts
+
+
+def _parse_retry_after(retry_after):
+    if not retry_after:
+        return None
+
+    try:
+        return float(retry_after)
+    except ValueError:  # HTTP-date form; let the caller fall through
+        return None
+
+
+def _region_hosts(region):
+    try:
+        return _REGION_HOSTS[region]
+    except KeyError:
+        return f'https://{region}.api.blizzard.com', f'https://{region}.battle.net'
+
+
+class _TokenBucket:
+    """
+    Classic token bucket: `rate` tokens accrue per second up to
+    `capacity`; `acquire` blocks until one is available. Thread-safe.
+    """
+
+    def __init__(self, rate, capacity):
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._capacity, self._tokens + (now - self._updated) * self._rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self._rate
+            time.sleep(wait)
+
+
 class WowApi(GameDataMixin, ProfileMixin):
     """
     ```python
@@ -24,52 +157,147 @@ class WowApi(GameDataMixin, ProfileMixin):
     api = WowApi('client_id', 'client_secret')
 
     # Token price
-    api.get_token('eu', namespace='dynamic-eu', locale='de_DE')
+    api.get_token_index('eu', namespace='dynamic-eu', locale='de_DE')
 
     # Auctions
-    api.get_auctions('eu', 'silvermoon', locale='de_DE')
+    api.get_auctions('eu', 'dynamic-eu', 1602, locale='de_DE')
     ```
     """
 
-    __base_url = '{0}.api.blizzard.com'
-
-    def __init__(self, client_id, client_secret, retry_conn_failures=False):
+    # process-wide Session for short-lived instances; see _get_shared_session
+    _shared_session = None
+    _shared_session_lock = threading.Lock()
+
+    @classmethod
+    def _get_shared_session(cls, pool_connections, pool_maxsize):
+        # keep-alive connections on the shared Session survive across
+        # WowApi constructions, so per-request instantiation patterns
+        # (CLI tools, web workers) still benefit from pooling. The pool
+        # is sized by whichever instance creates it first.
+        with cls._shared_session_lock:
+            if cls._shared_session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                cls._shared_session = session
+        return cls._shared_session
+
+    def __init__(self, client_id, client_secret, retry_conn_failures=False,
+                 pool_connections=20, pool_maxsize=100, share_pool=False,
+                 timeout=None, rate_limit=None,
+                 cache=False, cache_maxsize=1024, cache_ttl=3600,
+                 prewarm=()):
         self._client_id = client_id
         self._client_secret = client_secret
 
-        self._session = requests.Session()
+        # opt-in response cache: a hit skips the network round-trip
+        # entirely, which dwarfs any in-code optimization for the mostly
+        # static Game Data endpoints
+        if cache:
+            if TTLCache is None:
+                raise WowApiException(
+                    'cachetools must be installed to enable response caching')
+            self._cache = TTLCache(maxsize=cache_maxsize, ttl=cache_ttl)
+        else:
+            self._cache = None
+
+        self._pool_connections = pool_connections
+        self._pool_maxsize = pool_maxsize
+
+        # applied to every request when set, so a stalled server
+        # cannot hang callers indefinitely; (connect, read) tuples
+        # are passed straight through to requests
+        self._timeout = timeout
+
+        # opt-in client-side rate limiting: staying under Blizzard's
+        # quota (100 req/s) avoids 429 responses, which still count
+        # against it. A (rate, capacity) tuple allows larger bursts.
+        if rate_limit:
+            if not isinstance(rate_limit, tuple):
+                rate_limit = (rate_limit, rate_limit)
+            self._bucket = _TokenBucket(*rate_limit)
+        else:
+            self._bucket = None
+
+        if share_pool:
+            self._session = self._get_shared_session(pool_connections, pool_maxsize)
+        else:
+            self._session = requests.Session()
+            self._mount_adapter()
 
         # Use default retry setup
         if retry_conn_failures:
             self.retry_conn_failures()
 
         self._access_tokens = {}
-
-    def _utcnow(self):
-        return datetime.utcnow()
+        self._base_params = {}
+        self._token_lock = threading.Lock()
+
+        # overlap TLS setup for the given regions with application startup
+        # so the first real call sees warm connection pools
+        if prewarm:
+            self._prewarm_executor = ThreadPoolExecutor(max_workers=len(prewarm))
+            for region in prewarm:
+                self._prewarm_executor.submit(self.prewarm, region)
+            self._prewarm_executor.shutdown(wait=False)
+
+    def prewarm(self, region):
+        """
+        Open connections to both API hosts for a region up-front, so the
+        first real call does not pay the TCP+TLS handshakes for
+        `*.api.blizzard.com` and the battle.net OAuth host.
+        """
+        api_host, oauth_host = _region_hosts(region)
+        # best-effort background work: always cap the wait so a stalled
+        # host cannot hang the prewarm thread indefinitely
+        timeout = self._timeout if self._timeout is not None else 10
+        for url in (api_host + '/', oauth_host):
+            try:
+                self._session.head(url, timeout=timeout)
+            except RequestException as exc:
+                logger.info('Prewarm of %s failed: %s', url, exc)
+
+    def _mount_adapter(self, max_retries=0):
+        # never remount on the process-wide shared Session: that would
+        # change retry behaviour and pool sizing for every instance
+        # sharing it and discard its warm connections. An instance that
+        # wants its own adapter drops back to a private session.
+        if self._session is WowApi._shared_session:
+            self._session = requests.Session()
+
+        # size the urllib3 pool up-front so threaded callers do not
+        # serialize on the default 10 connections per host
+        adapter = HTTPAdapter(
+            pool_connections=self._pool_connections,
+            pool_maxsize=self._pool_maxsize,
+            max_retries=max_retries)
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
 
     def retry_conn_failures(self, total=5, backoff_factor=1,
-                            status_forcelist=[443, 500, 502, 503, 504]):
-        # Allows a user to control how retries function
+                            status_forcelist=frozenset({429, 500, 502, 503, 504})):
+        # Allows a user to control how retries function.
+        # 429 is retried so rate-limited calls honour the Retry-After
+        # header instead of failing; the previous default listed 443,
+        # which is a TCP port and never matches a response status.
         retries = Retry(total=total, backoff_factor=backoff_factor,
-                        status_forcelist=status_forcelist)
-        self._session.mount('http://', HTTPAdapter(max_retries=retries))
-        self._session.mount('https://', HTTPAdapter(max_retries=retries))
+                        status_forcelist=status_forcelist,
+                        respect_retry_after_header=True)
+        self._mount_adapter(max_retries=retries)
 
     def _get_client_credentials(self, region):
-        path = '/oauth/token?grant_type=client_credentials&client_id={0}&client_secret={1}'.format(
-            self._client_id, self._client_secret
+        oauth_host = _region_hosts(region)[1]
+        url = (
+            f'{oauth_host}/oauth/token?grant_type=client_credentials'
+            f'&client_id={self._client_id}&client_secret={self._client_secret}'
         )
 
-        url = 'https://{0}.battle.net{1}'.format(region, path)
-        if region == 'cn':
-            url = 'https://www.battlenet.com.cn{0}'.format(path)
-
-        logger.info('Fetching new token from: {0}'.format(url))
+        logger.info('Fetching new token from: %s', url)
 
-        now = self._utcnow()
         try:
-            response = self._session.post(url)
+            response = self._session.post(url, timeout=self._timeout)
         except RequestException as exc:
             logger.exception(str(exc))
             raise WowApiOauthException(str(exc))
@@ -80,20 +308,41 @@ class WowApi(GameDataMixin, ProfileMixin):
             raise WowApiOauthException(msg)
 
         try:
-            json = response.json()
+            json = _loads(response.content)
         except Exception:
             msg = 'Invalid Json in OAuth response: {0} for {1}'.format(response.content, url)
             logger.exception(msg)
             raise WowApiOauthException(msg)
 
         token = json['access_token']
-        expiration = now + timedelta(seconds=json['expires_in'])
-        logger.info('New token {0} expires at {1} UTC'.format(token, expiration))
-
-        self._access_tokens[region] = {
-            'token': token,
-            'expiration': expiration
-        }
+        expires_in = json['expires_in']
+        logger.info('New token %s expires in %s seconds', token, expires_in)
+
+        # refresh the token 30 seconds before expiry.
+        # this protects against the rare occurrence of hitting
+        # the API right as your token expires, causing errors.
+        self._access_tokens[region] = (token, time.monotonic() + expires_in - 30)
+        self._base_params[region] = {'access_token': token}
+
+    def _region_params(self, region):
+        # params shared by every call for a region are built once per
+        # token instead of once per request; merged into a fresh dict by
+        # the callers, so the template itself is never mutated
+        try:
+            return self._base_params[region]
+        except KeyError:
+            params = {'access_token': self._access_tokens[region][0]}
+            self._base_params[region] = params
+            return params
+
+    def _refresh_token(self, region):
+        # double-checked locking: when concurrent callers all see an
+        # expired token, only the first one holding the lock refreshes;
+        # the rest find a fresh deadline and skip the OAuth round-trip
+        with self._token_lock:
+            token = self._access_tokens.get(region)
+            if token is None or time.monotonic() >= token[1]:
+                self._get_client_credentials(region)
 
     def get_data_resource(self, url, region, **filters):
         """
@@ -102,68 +351,329 @@ class WowApi(GameDataMixin, ProfileMixin):
         `api.get_data_resource` takes care of this.
 
         ```python
-        auctions_ref = api.get_auctions('eu', 'silvermoon', locale='de_DE')
+        auctions_ref = api.get_auctions('eu', 'dynamic-eu', 1602, locale='de_DE')
         api.get_data_resource(auctions_ref['files'][0]['url'], 'eu')
         ```
         """
-        access_token = self._access_tokens.get(region, {}).get('token', '')
-        if access_token:
-            filters['access_token'] = access_token
+        token = self._access_tokens.get(region)
+        if token is not None:
+            # merge into a fresh dict instead of mutating the caller's filters
+            params = {**filters, 'access_token': token[0]}
+        else:
+            params = filters
+
+        return self._handle_request(url, region=region, params=params)
+
+    def _cache_key(self, url, kwargs):
+        params = kwargs.get('params')
+        if not params:
+            return (url, None)
+        # the access token is not part of the resource identity: keying
+        # without it keeps entries valid across token refreshes instead
+        # of silently invalidating the whole cache every ~24 hours
+        return (url, frozenset(
+            item for item in params.items() if item[0] != 'access_token'))
+
+    def _handle_request(self, url, region=None, stream=False, **kwargs):
+        cache_key = None
+        validator = None
+        if self._cache is not None and not stream:
+            cache_key = self._cache_key(url, kwargs)
+            hit = self._cache.get(cache_key)
+            if hit is not None:
+                if time.monotonic() < hit[1]:
+                    return hit[0]
+                if hit[2] is not None:
+                    # stale entry with an ETag: revalidate instead of
+                    # re-downloading; a 304 costs headers, not the body
+                    validator = hit
+                    headers = dict(kwargs.get('headers') or {})
+                    headers['If-None-Match'] = hit[2]
+                    kwargs['headers'] = headers
+
+        if self._timeout is not None:
+            kwargs.setdefault('timeout', self._timeout)
+
+        # rate limit only actual network traffic, never cache hits
+        if self._bucket is not None:
+            self._bucket.acquire()
+
+        # bounded iterative retry: at most one token refresh or
+        # Retry-After pause per call, so misconfigured credentials and
+        # persistent rate limiting fail fast instead of looping
+        for attempt in range(2):
+            try:
+                if stream:
+                    response = self._session.get(url, stream=True, **kwargs)
+                else:
+                    response = self._session.get(url, **kwargs)
+            except RequestException as exc:
+                logger.exception(str(exc))
+                raise WowApiException(str(exc))
+
+            if response.status_code == 429 and not attempt:
+                delay = _parse_retry_after(response.headers.get('retry-after'))
+                if delay is not None:
+                    logger.info('Rate limited, retrying in %s seconds', delay)
+                    time.sleep(delay)
+                    continue
+
+            if response.status_code != 401 or region is None or attempt:
+                break
+
+            # the token was rejected before its local deadline passed:
+            # refresh once and retry with the new credentials
+            logger.info('Access token rejected, refreshing for region: %s', region)
+            with self._token_lock:
+                self._get_client_credentials(region)
+            if 'params' in kwargs:
+                kwargs['params'] = {**kwargs['params'], **self._base_params[region]}
 
-        return self._handle_request(url, params=filters)
-
-    def _handle_request(self, url, **kwargs):
-        try:
-            response = self._session.get(url, **kwargs)
-        except RequestException as exc:
-            logger.exception(str(exc))
-            raise WowApiException(str(exc))
+        if validator is not None and response.status_code == 304:
+            data = validator[0]
+            self._cache[cache_key] = (
+                data, time.monotonic() + self._cache.ttl, validator[2])
+            return data
 
         if not response.ok:
             msg = 'Invalid response - {0} - {1}'.format(url, response.status_code)
             logger.warning(msg)
             raise WowApiException(msg)
 
+        if stream:
+            return response
+
         try:
-            return response.json()
+            data = _loads(response.content)
         except Exception:
             msg = 'Invalid Json: {0} for {1}'.format(response.content, url)
             logger.exception(msg)
             raise WowApiException(msg)
 
+        if cache_key is not None:
+            # honour a Cache-Control max-age shorter than the default ttl
+            max_age = _parse_max_age(response.headers.get('cache-control'))
+            ttl = self._cache.ttl if max_age is None else min(max_age, self._cache.ttl)
+            self._cache[cache_key] = (
+                data, time.monotonic() + ttl, response.headers.get('etag'))
+
+        return data
+
     def get_resource(self, resource, region, *args, **filters):
-        resource = resource.format(*args)
+        # zero-arg paths skip str.format's placeholder scan entirely
+        if args:
+            resource = resource.format(*args)
 
-        # fetch access token on first run for region
-        if region not in self._access_tokens:
+        # fetch access token on first run for region, or when close to expiry
+        token = self._access_tokens.get(region)
+        if token is None or time.monotonic() >= token[1]:
             logger.info('Fetching access token..')
-            self._get_client_credentials(region)
-        else:
-            now = self._utcnow()
-            # refresh access token if expiring in the next 30 seconds.
-            # this protects against the rare occurrence of hitting
-            # the API right as your token expires, causing errors.
-            if now >= self._access_tokens[region]['expiration'] - timedelta(seconds=30):
-                logger.info('Access token expired. Fetching new token..')
-                self._get_client_credentials(region)
+            self._refresh_token(region)
 
-        filters['access_token'] = self._access_tokens[region]['token']
+        params = {**filters, **self._region_params(region)}
         url = self._format_base_url(resource, region)
-        logger.info('Requesting resource: {0} with parameters: {1}'.format(url, filters))
-        return self._handle_request(url, params=filters)
+        logger.info('Requesting resource: %s with parameters: %s', url, params)
+        return self._handle_request(url, region=region, params=params)
+
+    def get_items_bulk(self, region, namespace, ids, workers=10):
+        """
+        Item API - Returns multiple items by id, fetched concurrently
+
+        Fans the requests out over a thread pool sharing the pooled
+        session, so total wall time approaches one round-trip instead of
+        one per id. Results keep the order of `ids`.
+
+        ```python
+        items = api.get_items_bulk('us', 'static-us', [19019, 19020, 19021])
+        ```
+        """
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(
+                lambda id: self.get_item_data(region, namespace, id), ids))
+
+    def parallel(self, calls, max_workers=16):
+        """
+        Executes several API calls concurrently for callers that cannot
+        migrate to asyncio. `calls` is an iterable of
+        (method name, args, kwargs) tuples; results keep the order of
+        `calls` and any exception is re-raised in the caller's thread.
+
+        ```python
+        realms, item = api.parallel([
+            ('get_realm_index', ('us',), {'namespace': 'dynamic-us'}),
+            ('get_item_data', ('us', 'static-us', 19019), {}),
+        ])
+        ```
+        """
+        calls = list(calls)
+        if not calls:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(calls))) as executor:
+            futures = [
+                executor.submit(getattr(self, name), *args, **kwargs)
+                for name, args, kwargs in calls
+            ]
+            return [future.result() for future in futures]
+
+    def batch(self, requests, max_workers=16, return_exceptions=False):
+        """
+        Dispatches a list of request descriptions concurrently and
+        returns the results in input order. Each description is a dict
+        with a 'method' name plus optional 'args' and 'kwargs':
+
+        ```python
+        profile, equipment = api.batch([
+            {'method': 'get_character_profile_summary',
+             'args': ('us', 'profile-us', 'khadgar', 'asmon')},
+            {'method': 'get_character_equipment_summary',
+             'args': ('us', 'profile-us', 'khadgar', 'asmon')},
+        ])
+        ```
+
+        With `return_exceptions=True` a failed request yields its
+        exception in place of a result instead of aborting the batch,
+        mirroring `asyncio.gather`.
+        """
+        calls = [
+            (request['method'], request.get('args', ()), request.get('kwargs', {}))
+            for request in requests
+        ]
+        if not calls:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(calls))) as executor:
+            futures = [
+                executor.submit(getattr(self, name), *args, **kwargs)
+                for name, args, kwargs in calls
+            ]
+            if return_exceptions:
+                return [future.exception() or future.result() for future in futures]
+            return [future.result() for future in futures]
+
+    def get_character_full_profile(self, region, namespace, realm_slug, character_name,
+                                   include=None, **filters):
+        """
+        Fetches the character sub-resources a character page typically
+        needs in one concurrent burst instead of eight sequential
+        round-trips. Returns a dict keyed by part name; `include` limits
+        the fetched parts:
+
+        ```python
+        data = api.get_character_full_profile(
+            'us', 'profile-us', 'khadgar', 'asmon',
+            include=['profile', 'equipment'])
+        data['equipment']
+        ```
+        """
+        parts = _full_profile_parts(include)
+
+        def fetch(part):
+            method = getattr(self, _FULL_PROFILE_PARTS[part])
+            # each call gets its own filters dict: the wrappers add the
+            # namespace key, which must not race across threads
+            return method(region, namespace, realm_slug, character_name, **dict(filters))
+
+        with ThreadPoolExecutor(max_workers=len(parts)) as executor:
+            return dict(zip(parts, executor.map(fetch, parts)))
+
+    def stream_resource(self, resource, region, item_path, *args, **filters):
+        """
+        Stream items from a large resource instead of materializing the
+        full payload in memory, keeping peak memory at one record instead
+        of the whole decoded tree. Requires the optional `ijson` package.
+
+        `item_path` is an ijson path pointing at the items to yield:
+
+        ```python
+        auctions = api.stream_resource(
+            'data/wow/connected-realm/{0}/auctions', 'eu', 'auctions.item',
+            1146, namespace='dynamic-eu')
+        for auction in auctions:
+            ...
+        ```
+        """
+        if ijson is None:
+            raise WowApiException('ijson must be installed to stream resources')
+
+        # zero-arg paths skip str.format's placeholder scan entirely
+        if args:
+            resource = resource.format(*args)
+
+        # fetch access token on first run for region, or when close to expiry
+        token = self._access_tokens.get(region)
+        if token is None or time.monotonic() >= token[1]:
+            logger.info('Fetching access token..')
+            self._refresh_token(region)
+
+        params = {**filters, **self._region_params(region)}
+        url = self._format_base_url(resource, region)
+        logger.info('Streaming resource: %s with parameters: %s', url, params)
+        response = self._handle_request(url, region=region, stream=True, params=params)
+        response.raw.decode_content = True
+        try:
+            for item in ijson.items(response.raw, item_path):
+                yield item
+        finally:
+            response.close()
+
+    def get_pvp_leaderboard_df(self, region, namespace, season_id, bracket, **filters):
+        """
+        PvP Season API - Returns a leaderboard as a polars DataFrame
+
+        Entries land in contiguous columns, so top-N and per-faction
+        aggregations run as vectorized operations instead of Python
+        loops over thousands of dicts. Requires the optional `polars`
+        package.
+
+        ```python
+        df = api.get_pvp_leaderboard_df('us', 'dynamic-us', 27, '3v3')
+        df.sort('rating', descending=True).head(10)
+        ```
+        """
+        if polars is None:
+            raise WowApiException(
+                'polars must be installed to build leaderboard DataFrames')
+
+        leaderboard = self.get_pvp_leaderboard(
+            region, namespace, season_id, bracket, **filters)
+        entries = leaderboard.get('entries', [])
+        if not entries:
+            # from_dicts cannot infer a schema from zero rows
+            return polars.DataFrame()
+        return polars.from_dicts(entries)
+
+    def stream_pvp_leaderboard(self, region, namespace, season_id, bracket, **filters):
+        """
+        PvP Season API - Streams leaderboard entries one at a time
+
+        A leaderboard can hold thousands of entries; consumers that want
+        the top-K or filter by faction can iterate without materializing
+        the full list. Requires the optional `ijson` package.
+
+        ```python
+        for entry in api.stream_pvp_leaderboard('us', 'dynamic-us', 27, '3v3'):
+            if entry['rating'] < 2400:
+                break
+        ```
+        """
+        filters['namespace'] = namespace
+        return self.stream_resource(
+            'data/wow/pvp-season/{0}/pvp-leaderboard/{1}', region, 'entries.item',
+            season_id, bracket, **filters)
 
     def get_oauth_resource(self, resource, region, token, *args, **filters):
-        filters['access_token'] = token
+        params = {**filters, 'access_token': token}
 
-        resource = resource.format(*args)
+        # zero-arg paths skip str.format's placeholder scan entirely
+        if args:
+            resource = resource.format(*args)
 
         url = self._format_base_url(resource, region)
-        logger.info('Requesting resource: {0} with parameters: {1}'.format(url, filters))
-        return self._handle_request(url, params=filters)
+        logger.info('Requesting resource: %s with parameters: %s', url, params)
+        # no region: the caller's user token cannot be replaced by a
+        # client-credentials refresh, so a 401 should surface directly
+        return self._handle_request(url, params=params)
 
     def _format_base_url(self, resource, region):
-        base_url = self.__base_url.format(region)
-        if region == 'cn':
-            base_url = 'www.gateway.battlenet.com.cn'
-
-        return 'https://{0}/{1}'.format(base_url, resource)
+        return _region_hosts(region)[0] + '/' + resource
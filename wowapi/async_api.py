@@ -0,0 +1,344 @@
+import asyncio
+import logging
+import time
+
+import aiohttp
+
+from .api import (
+    _FULL_PROFILE_PARTS, _full_profile_parts, _loads, _parse_retry_after, _region_hosts
+)
+from .exceptions import WowApiException, WowApiOauthException
+from .mixins import GameDataMixin, ProfileMixin
+
+
+logger = logging.getLogger('wowapi')
+
+
+class _AsyncTokenBucket:
+    """
+    Classic token bucket: `rate` tokens accrue per second up to
+    `capacity`; `acquire` suspends the task until one is available.
+    """
+
+    def __init__(self, rate, capacity):
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        while True:
+            async with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._capacity, self._tokens + (now - self._updated) * self._rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self._rate
+            await asyncio.sleep(wait)
+
+
+class AsyncWowApi(GameDataMixin, ProfileMixin):
+    """
+    aiohttp based variant of ``WowApi`` for concurrent I/O-bound workloads.
+
+    All endpoint methods return coroutines and can be fanned out with
+    ``asyncio.gather`` to overlap network round-trips:
+
+    ```python
+    import asyncio
+
+    from wowapi import AsyncWowApi
+
+    async def main():
+        async with AsyncWowApi('client_id', 'client_secret') as api:
+            items = await asyncio.gather(*[
+                api.get_item_data('us', 'static-us', item_id)
+                for item_id in range(19019, 19119)
+            ])
+
+    asyncio.run(main())
+    ```
+    """
+
+    def __init__(self, client_id, client_secret, timeout=None, rate_limit=None):
+        self._client_id = client_id
+        self._client_secret = client_secret
+
+        # applied to every request when set, so a stalled server
+        # cannot hang callers indefinitely
+        self._timeout = timeout
+
+        # opt-in client-side rate limiting: staying under Blizzard's
+        # quota (100 req/s) avoids 429 responses, which still count
+        # against it. A (rate, capacity) tuple allows larger bursts.
+        if rate_limit:
+            if not isinstance(rate_limit, tuple):
+                rate_limit = (rate_limit, rate_limit)
+            self._bucket = _AsyncTokenBucket(*rate_limit)
+        else:
+            self._bucket = None
+
+        # created lazily so instantiation works outside a running event loop
+        self._session = None
+
+        self._access_tokens = {}
+        self._base_params = {}
+        self._token_lock = asyncio.Lock()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    def _get_session(self):
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=100, limit_per_host=30, ttl_dns_cache=300, keepalive_timeout=75)
+            kwargs = {}
+            if self._timeout is not None:
+                kwargs['timeout'] = aiohttp.ClientTimeout(total=self._timeout)
+            self._session = aiohttp.ClientSession(connector=connector, **kwargs)
+
+        return self._session
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    async def _get_client_credentials(self, region):
+        oauth_host = _region_hosts(region)[1]
+        url = (
+            f'{oauth_host}/oauth/token?grant_type=client_credentials'
+            f'&client_id={self._client_id}&client_secret={self._client_secret}'
+        )
+
+        logger.info('Fetching new token from: %s', url)
+
+        session = self._get_session()
+        try:
+            async with session.post(url) as response:
+                if response.status >= 400:
+                    msg = 'Invalid response - {0} for {1}'.format(response.status, url)
+                    logger.warning(msg)
+                    raise WowApiOauthException(msg)
+
+                content = await response.read()
+                try:
+                    json = _loads(content)
+                except Exception:
+                    msg = 'Invalid Json in OAuth response: {0} for {1}'.format(content, url)
+                    logger.exception(msg)
+                    raise WowApiOauthException(msg)
+        except aiohttp.ClientError as exc:
+            logger.exception(str(exc))
+            raise WowApiOauthException(str(exc))
+
+        token = json['access_token']
+        expires_in = json['expires_in']
+        logger.info('New token %s expires in %s seconds', token, expires_in)
+
+        # refresh the token 30 seconds before expiry.
+        # this protects against the rare occurrence of hitting
+        # the API right as your token expires, causing errors.
+        self._access_tokens[region] = (token, time.monotonic() + expires_in - 30)
+        self._base_params[region] = {'access_token': token}
+
+    def _region_params(self, region):
+        # params shared by every call for a region are built once per
+        # token instead of once per request; merged into a fresh dict by
+        # the callers, so the template itself is never mutated
+        try:
+            return self._base_params[region]
+        except KeyError:
+            params = {'access_token': self._access_tokens[region][0]}
+            self._base_params[region] = params
+            return params
+
+    async def _refresh_token(self, region):
+        # double-checked locking: when concurrent tasks all see an
+        # expired token, only the first one holding the lock refreshes;
+        # the rest find a fresh deadline and skip the OAuth round-trip
+        async with self._token_lock:
+            token = self._access_tokens.get(region)
+            if token is None or time.monotonic() >= token[1]:
+                await self._get_client_credentials(region)
+
+    async def get_data_resource(self, url, region, **filters):
+        """
+        Some endpoints return a url pointing to another resource.
+        These urls do not include OAuth tokens.
+        `api.get_data_resource` takes care of this.
+
+        ```python
+        auctions_ref = await api.get_auctions('eu', 'dynamic-eu', 1602, locale='de_DE')
+        await api.get_data_resource(auctions_ref['files'][0]['url'], 'eu')
+        ```
+        """
+        token = self._access_tokens.get(region)
+        if token is not None:
+            # merge into a fresh dict instead of mutating the caller's filters
+            params = {**filters, 'access_token': token[0]}
+        else:
+            params = filters
+
+        return await self._handle_request(url, region=region, params=params)
+
+    async def _handle_request(self, url, region=None, **kwargs):
+        session = self._get_session()
+        if self._bucket is not None:
+            await self._bucket.acquire()
+
+        # bounded iterative retry: at most one token refresh or
+        # Retry-After pause per call, so misconfigured credentials and
+        # persistent rate limiting fail fast instead of looping
+        for attempt in range(2):
+            try:
+                async with session.get(url, **kwargs) as response:
+                    if response.status == 429 and not attempt:
+                        delay = _parse_retry_after(response.headers.get('Retry-After'))
+                        if delay is not None:
+                            logger.info('Rate limited, retrying in %s seconds', delay)
+                            await asyncio.sleep(delay)
+                            continue
+
+                    if response.status == 401 and region is not None and not attempt:
+                        # the token was rejected before its local deadline
+                        # passed: refresh once and retry with the new
+                        # credentials
+                        logger.info(
+                            'Access token rejected, refreshing for region: %s', region)
+                        async with self._token_lock:
+                            await self._get_client_credentials(region)
+                        if 'params' in kwargs:
+                            kwargs['params'] = {
+                                **kwargs['params'], **self._base_params[region]}
+                        continue
+
+                    if response.status >= 400:
+                        msg = 'Invalid response - {0} - {1}'.format(url, response.status)
+                        logger.warning(msg)
+                        raise WowApiException(msg)
+
+                    content = await response.read()
+                    try:
+                        return _loads(content)
+                    except Exception:
+                        msg = 'Invalid Json: {0} for {1}'.format(content, url)
+                        logger.exception(msg)
+                        raise WowApiException(msg)
+            except aiohttp.ClientError as exc:
+                logger.exception(str(exc))
+                raise WowApiException(str(exc))
+
+    async def get_resource(self, resource, region, *args, **filters):
+        # zero-arg paths skip str.format's placeholder scan entirely
+        if args:
+            resource = resource.format(*args)
+
+        # fetch access token on first run for region, or when close to expiry
+        token = self._access_tokens.get(region)
+        if token is None or time.monotonic() >= token[1]:
+            logger.info('Fetching access token..')
+            await self._refresh_token(region)
+
+        params = {**filters, **self._region_params(region)}
+        url = self._format_base_url(resource, region)
+        logger.info('Requesting resource: %s with parameters: %s', url, params)
+        return await self._handle_request(url, region=region, params=params)
+
+    async def batch(self, requests, return_exceptions=False):
+        """
+        Dispatches a list of request descriptions concurrently and
+        returns the results in input order. Each description is a dict
+        with a 'method' name plus optional 'args' and 'kwargs'. With
+        `return_exceptions=True` a failed request yields its exception
+        in place of a result instead of aborting the batch.
+        """
+        results = await asyncio.gather(*[
+            getattr(self, request['method'])(
+                *request.get('args', ()), **request.get('kwargs', {}))
+            for request in requests
+        ], return_exceptions=return_exceptions)
+        return list(results)
+
+    async def get_character_full_profile(self, region, namespace, realm_slug,
+                                         character_name, include=None, **filters):
+        """
+        Fetches the character sub-resources a character page typically
+        needs in one concurrent burst instead of eight sequential
+        round-trips. Returns a dict keyed by part name; `include` limits
+        the fetched parts.
+        """
+        parts = _full_profile_parts(include)
+
+        results = await asyncio.gather(*[
+            getattr(self, _FULL_PROFILE_PARTS[part])(
+                region, namespace, realm_slug, character_name, **dict(filters))
+            for part in parts
+        ])
+        return dict(zip(parts, results))
+
+    async def stream_token(self, region, namespace=None, interval=60, **filters):
+        """
+        WoW Token API - Polls the token price as an async stream
+
+        Keeps one warm connection for the whole polling loop and
+        revalidates with If-None-Match, so a steady-state poll costs a
+        304's headers; a payload is only yielded when the price actually
+        changed.
+
+        ```python
+        async for price in api.stream_token('eu', interval=300):
+            ...
+        ```
+        """
+        if namespace is None:
+            namespace = 'dynamic-{0}'.format(region)
+        filters['namespace'] = namespace
+
+        url = self._format_base_url('data/wow/token/index', region)
+        etag = None
+        while True:
+            token = self._access_tokens.get(region)
+            if token is None or time.monotonic() >= token[1]:
+                await self._refresh_token(region)
+
+            params = {**filters, **self._region_params(region)}
+            headers = {'If-None-Match': etag} if etag else {}
+            session = self._get_session()
+            try:
+                async with session.get(url, params=params, headers=headers) as response:
+                    if response.status == 200:
+                        etag = response.headers.get('ETag', etag)
+                        content = await response.read()
+                        yield _loads(content)
+                    elif response.status != 304:
+                        msg = 'Invalid response - {0} - {1}'.format(url, response.status)
+                        logger.warning(msg)
+                        raise WowApiException(msg)
+            except aiohttp.ClientError as exc:
+                logger.exception(str(exc))
+                raise WowApiException(str(exc))
+
+            await asyncio.sleep(interval)
+
+    async def get_oauth_resource(self, resource, region, token, *args, **filters):
+        params = {**filters, 'access_token': token}
+
+        # zero-arg paths skip str.format's placeholder scan entirely
+        if args:
+            resource = resource.format(*args)
+
+        url = self._format_base_url(resource, region)
+        logger.info('Requesting resource: %s with parameters: %s', url, params)
+        # no region: the caller's user token cannot be replaced by a
+        # client-credentials refresh, so a 401 should surface directly
+        return await self._handle_request(url, params=params)
+
+    def _format_base_url(self, resource, region):
+        return _region_hosts(region)[0] + '/' + resource
@@ -0,0 +1,188 @@
+import logging
+import threading
+import time
+
+import httpx
+
+from .api import _loads, _region_hosts
+from .exceptions import WowApiException, WowApiOauthException
+from .mixins import GameDataMixin, ProfileMixin
+
+
+logger = logging.getLogger('wowapi')
+
+
+class HTTPXWowApi(GameDataMixin, ProfileMixin):
+    """
+    httpx based variant of ``WowApi`` speaking HTTP/2.
+
+    Nearly every call targets the same regional host, so HTTP/2 stream
+    multiplexing lets concurrent requests share a single TCP+TLS
+    connection instead of competing for pool slots:
+
+    ```python
+    from wowapi import HTTPXWowApi
+
+    with HTTPXWowApi('client_id', 'client_secret') as api:
+        api.get_token_index('eu', namespace='dynamic-eu', locale='de_DE')
+    ```
+    """
+
+    def __init__(self, client_id, client_secret,
+                 max_connections=20, max_keepalive_connections=20):
+        self._client_id = client_id
+        self._client_secret = client_secret
+
+        self._client = httpx.Client(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections))
+
+        self._access_tokens = {}
+        self._base_params = {}
+        self._token_lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        self._client.close()
+
+    def _get_client_credentials(self, region):
+        oauth_host = _region_hosts(region)[1]
+        url = (
+            f'{oauth_host}/oauth/token?grant_type=client_credentials'
+            f'&client_id={self._client_id}&client_secret={self._client_secret}'
+        )
+
+        logger.info('Fetching new token from: %s', url)
+
+        try:
+            response = self._client.post(url)
+        except httpx.HTTPError as exc:
+            logger.exception(str(exc))
+            raise WowApiOauthException(str(exc))
+
+        if response.status_code >= 400:
+            msg = 'Invalid response - {0} for {1}'.format(response.status_code, url)
+            logger.warning(msg)
+            raise WowApiOauthException(msg)
+
+        try:
+            json = _loads(response.content)
+        except Exception:
+            msg = 'Invalid Json in OAuth response: {0} for {1}'.format(response.content, url)
+            logger.exception(msg)
+            raise WowApiOauthException(msg)
+
+        token = json['access_token']
+        expires_in = json['expires_in']
+        logger.info('New token %s expires in %s seconds', token, expires_in)
+
+        # refresh the token 30 seconds before expiry.
+        # this protects against the rare occurrence of hitting
+        # the API right as your token expires, causing errors.
+        self._access_tokens[region] = (token, time.monotonic() + expires_in - 30)
+        self._base_params[region] = {'access_token': token}
+
+    def _region_params(self, region):
+        # params shared by every call for a region are built once per
+        # token instead of once per request; merged into a fresh dict by
+        # the callers, so the template itself is never mutated
+        try:
+            return self._base_params[region]
+        except KeyError:
+            params = {'access_token': self._access_tokens[region][0]}
+            self._base_params[region] = params
+            return params
+
+    def _refresh_token(self, region):
+        # double-checked locking: when concurrent callers all see an
+        # expired token, only the first one holding the lock refreshes;
+        # the rest find a fresh deadline and skip the OAuth round-trip
+        with self._token_lock:
+            token = self._access_tokens.get(region)
+            if token is None or time.monotonic() >= token[1]:
+                self._get_client_credentials(region)
+
+    def get_data_resource(self, url, region, **filters):
+        """
+        Some endpoints return a url pointing to another resource.
+        These urls do not include OAuth tokens.
+        `api.get_data_resource` takes care of this.
+        """
+        token = self._access_tokens.get(region)
+        if token is not None:
+            # merge into a fresh dict instead of mutating the caller's filters
+            params = {**filters, 'access_token': token[0]}
+        else:
+            params = filters
+
+        return self._handle_request(url, region=region, params=params)
+
+    def _handle_request(self, url, region=None, **kwargs):
+        # bounded iterative retry: at most one token refresh per call, so
+        # misconfigured credentials fail fast instead of looping
+        for attempt in range(2):
+            try:
+                response = self._client.get(url, **kwargs)
+            except httpx.HTTPError as exc:
+                logger.exception(str(exc))
+                raise WowApiException(str(exc))
+
+            if response.status_code != 401 or region is None or attempt:
+                break
+
+            # the token was rejected before its local deadline passed:
+            # refresh once and retry with the new credentials
+            logger.info('Access token rejected, refreshing for region: %s', region)
+            with self._token_lock:
+                self._get_client_credentials(region)
+            if 'params' in kwargs:
+                kwargs['params'] = {**kwargs['params'], **self._base_params[region]}
+
+        if response.status_code >= 400:
+            msg = 'Invalid response - {0} - {1}'.format(url, response.status_code)
+            logger.warning(msg)
+            raise WowApiException(msg)
+
+        try:
+            return _loads(response.content)
+        except Exception:
+            msg = 'Invalid Json: {0} for {1}'.format(response.content, url)
+            logger.exception(msg)
+            raise WowApiException(msg)
+
+    def get_resource(self, resource, region, *args, **filters):
+        # zero-arg paths skip str.format's placeholder scan entirely
+        if args:
+            resource = resource.format(*args)
+
+        # fetch access token on first run for region, or when close to expiry
+        token = self._access_tokens.get(region)
+        if token is None or time.monotonic() >= token[1]:
+            logger.info('Fetching access token..')
+            self._refresh_token(region)
+
+        params = {**filters, **self._region_params(region)}
+        url = self._format_base_url(resource, region)
+        logger.info('Requesting resource: %s with parameters: %s', url, params)
+        return self._handle_request(url, region=region, params=params)
+
+    def get_oauth_resource(self, resource, region, token, *args, **filters):
+        params = {**filters, 'access_token': token}
+
+        # zero-arg paths skip str.format's placeholder scan entirely
+        if args:
+            resource = resource.format(*args)
+
+        url = self._format_base_url(resource, region)
+        logger.info('Requesting resource: %s with parameters: %s', url, params)
+        return self._handle_request(url, params=params)
+
+    def _format_base_url(self, resource, region):
+        return _region_hosts(region)[0] + '/' + resource
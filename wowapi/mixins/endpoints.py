@@ -0,0 +1,85 @@
+"""Helpers to build API endpoint methods from declarative tables.
+
+Each endpoint is described by a ``(method name, resource path, docstring)``
+tuple instead of a hand-written four-line wrapper. Generating the wrappers
+from one factory keeps the class small, shrinks import time and lets the
+interpreter specialize a single closure instead of dozens of unique
+functions.
+"""
+import re
+
+from ..exceptions import WowApiException
+
+
+_PLACEHOLDER = re.compile(r'\{(\w+)\}')
+
+
+def _resolve_namespace(name, namespace, namespace_type, region):
+    if namespace is not None:
+        return namespace
+    if namespace_type is None:
+        raise WowApiException('namespace is required for {0}'.format(name))
+    return '{0}-{1}'.format(namespace_type, region)
+
+
+def _bind_path_args(name, arg_names, args, filters):
+    # the hand-written wrappers took path parameters as named
+    # positionals (e.g. spec_id), so keep the keyword spellings working
+    # and fail loudly on a wrong count instead of sending a malformed
+    # request with the path left unformatted
+    if len(args) > len(arg_names):
+        raise WowApiException(
+            '{0}() takes {1} path arguments but {2} were given'.format(
+                name, len(arg_names), len(args)))
+
+    missing = arg_names[len(args):]
+    absent = [param for param in missing if param not in filters]
+    if absent:
+        raise WowApiException(
+            '{0}() missing path arguments: {1}'.format(name, ', '.join(absent)))
+
+    return args + tuple(filters.pop(param) for param in missing)
+
+
+def make_endpoint_method(name, resource, doc, namespace_type=None):
+    # convert '{param}' placeholders to '%s' once at class-definition
+    # time; %-substitution does not re-parse the template on every call
+    # the way str.format does. The placeholder names double as the
+    # keyword spellings of the path arguments.
+    arg_names = tuple(_PLACEHOLDER.findall(resource))
+    template = _PLACEHOLDER.sub('%s', resource)
+
+    def method(self, region, namespace=None, *args, **filters):
+        if len(args) != len(arg_names):
+            args = _bind_path_args(name, arg_names, args, filters)
+        filters['namespace'] = _resolve_namespace(name, namespace, namespace_type, region)
+        return self.get_resource(template % args if args else resource, region, **filters)
+
+    method.__name__ = name
+    method.__qualname__ = name
+    method.__doc__ = doc
+    return method
+
+
+def make_oauth_endpoint_method(name, resource, doc, namespace_type=None):
+    arg_names = tuple(_PLACEHOLDER.findall(resource))
+    template = _PLACEHOLDER.sub('%s', resource)
+
+    def method(self, region, namespace, token, *args, **filters):
+        if len(args) != len(arg_names):
+            args = _bind_path_args(name, arg_names, args, filters)
+        filters['namespace'] = _resolve_namespace(name, namespace, namespace_type, region)
+        return self.get_oauth_resource(
+            template % args if args else resource, region, token, **filters)
+
+    method.__name__ = name
+    method.__qualname__ = name
+    method.__doc__ = doc
+    return method
+
+
+def attach_endpoints(cls, endpoints, factory=make_endpoint_method, default_namespace=None):
+    for entry in endpoints:
+        name, resource, doc = entry[:3]
+        namespace_type = entry[3] if len(entry) > 3 else default_namespace
+        setattr(cls, name, factory(name, resource, doc, namespace_type))